@@ -1,9 +1,28 @@
-"""Build roster and draft value JSON files from Yahoo data."""
+"""Build roster and draft value JSON files from Yahoo data.
+
+Usage:  python3 scripts/build_roster_stats.py [--pretty]
+Output is compact JSON (it is only read by the site's JS); --pretty writes
+2-space indented files for inspecting by hand.
+"""
 
 import os
+import sys
 import json
 import numpy as np
 from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+
+# Fastest available JSON backend: orjson, then ujson, then the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 BASE_DIR = os.path.dirname(SCRIPT_DIR)
@@ -15,8 +34,8 @@ SEASONS = ["2022", "2023", "2024", "2025"]
 
 # Superflex 16-team league starter thresholds
 STARTER_THRESHOLDS = {"QB": 32, "RB": 40, "WR": 40, "TE": 16, "K": 16, "DEF": 16}
-SKILL_POSITIONS = {"QB", "RB", "WR", "TE", "K", "DEF"}
-DRAFT_VALUE_POSITIONS = {"QB", "RB", "WR", "TE", "DEF"}
+SKILL_POSITIONS = frozenset({"QB", "RB", "WR", "TE", "K", "DEF"})
+DRAFT_VALUE_POSITIONS = frozenset({"QB", "RB", "WR", "TE", "DEF"})
 
 # Team name -> owner mapping per season (from manual spreadsheet)
 TEAM_OWNER_MAP = {
@@ -94,18 +113,62 @@ TEAM_OWNER_MAP = {
     },
 }
 
+
+def _norm_team_name(name):
+    """Lowercase alphanumerics only, so "Sweeney." and "sweeney" compare equal."""
+    return "".join(ch for ch in name.lower() if ch.isalnum())
+
+
+# (season, normalized team name) -> owner. Emoji-only names normalize to ""
+# and are left out; they still match TEAM_OWNER_MAP exactly.
+NORM_OWNER_MAP = {
+    (season, _norm_team_name(name)): owner
+    for season, names in TEAM_OWNER_MAP.items()
+    for name, owner in names.items()
+    if _norm_team_name(name)
+}
+
 # Regular season weeks (before playoffs)
 REGULAR_SEASON_WEEKS = 14
 
 
+@lru_cache(maxsize=None)
 def load_json(path):
-    """Load JSON file, return empty list/dict if missing."""
+    """Load JSON file, return empty list/dict if missing.
+
+    Cached per path: several builders read the same season files, and the
+    results are treated as read-only.
+    """
     if not os.path.exists(path):
         return []
+    if orjson:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     with open(path) as f:
-        return json.load(f)
-
-
+        return (ujson or json).load(f)
+
+
+def dump_json(obj, path, pretty=False):
+    """Write obj to path as compact JSON, or 2-space indented with pretty=True.
+
+    orjson serializes straight to bytes; OPT_NON_STR_KEYS lets it accept the
+    same int/float dict keys the stdlib fallback would.
+    """
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=option))
+        return
+    with open(path, "w") as f:
+        if pretty:
+            (ujson or json).dump(obj, f, indent=2)
+        elif ujson:
+            ujson.dump(obj, f)  # compact by default
+        else:
+            json.dump(obj, f, separators=(",", ":"))
+
+
+@lru_cache(maxsize=None)
 def build_owner_map(season):
     """Build team_key -> owner name mapping from team names."""
     team_names = build_team_names(season)
@@ -120,27 +183,47 @@ def build_owner_map(season):
                 if map_name.strip() in tn or tn.strip() in map_name:
                     owner = map_owner
                     break
+        if not owner:
+            # Only after the substring scan, so names it already resolved keep
+            # their owner: 2025 "Sweeney" is inside "Sweeney Deez and Zaukas"
+            # (Mitch) and must not become "Sweeney." (Connor) here
+            owner = NORM_OWNER_MAP.get((season, _norm_team_name(tn)))
         owner_map[tk] = owner or tn
     return owner_map
 
 
+@lru_cache(maxsize=None)
 def build_team_names(season):
-    """Build team_key -> team_name mapping from draft + standings + matchups."""
-    names = {}
-    for src in ["standings.json", "draft.json"]:
-        data = load_json(os.path.join(YAHOO_DIR, season, src))
-        for entry in data:
-            tk = entry.get("team_key", "")
-            tn = entry.get("team_name", "")
-            if tk and tn:
-                names[tk] = tn
+    """Build team_key -> team_name mapping from draft + standings + matchups.
+
+    Later sources win, so matchup names override standings/draft names.
+    """
+    standings = load_json(os.path.join(YAHOO_DIR, season, "standings.json"))
+    draft = load_json(os.path.join(YAHOO_DIR, season, "draft.json"))
     matchups = load_json(os.path.join(YAHOO_DIR, season, "matchups.json"))
-    for m in matchups:
-        if m.get("team_1_key") and m.get("team_1"):
-            names[m["team_1_key"]] = m["team_1"]
-        if m.get("team_2_key") and m.get("team_2"):
-            names[m["team_2_key"]] = m["team_2"]
-    return names
+    pairs = chain(
+        ((e.get("team_key"), e.get("team_name")) for e in chain(standings, draft)),
+        ((m.get(f"team_{i}_key"), m.get(f"team_{i}")) for m in matchups for i in (1, 2)),
+    )
+    return {tk: tn for tk, tn in pairs if tk and tn}
+
+
+def aggregate_records(side, pts, opp_pts, weeks, n_teams):
+    """Per-team wins, losses, ties, PF and PA from one row per team per game.
+
+    side holds dense team ids; W/L/T count regular season games only
+    (weeks 1-14), while PF/PA include the playoffs.
+    """
+    regular = weeks <= REGULAR_SEASON_WEEKS
+    wins = np.bincount(side[regular & (pts > opp_pts)], minlength=n_teams)
+    losses = np.bincount(side[regular & (pts < opp_pts)], minlength=n_teams)
+    ties = np.bincount(side[regular & (pts == opp_pts)], minlength=n_teams)
+
+    pf = np.zeros(n_teams)
+    pa = np.zeros(n_teams)
+    np.add.at(pf, side, pts)
+    np.add.at(pa, side, opp_pts)
+    return wins, losses, ties, pf, pa
 
 
 def build_season_summaries(season, owner_map):
@@ -149,66 +232,54 @@ def build_season_summaries(season, owner_map):
     if not matchups:
         return {}
 
-    # Compute W/L/PF/PA per team
-    team_stats = defaultdict(lambda: {"wins": 0, "losses": 0, "ties": 0, "pf": 0.0, "pa": 0.0})
-    team_last_game = {}  # team_key -> {week, pts, opp_pts, opp}
-
-    for m in matchups:
-        t1k, t2k = m["team_1_key"], m["team_2_key"]
-        t1p, t2p = m["team_1_points"], m["team_2_points"]
-        week = m["week"]
-
-        # Regular season record (weeks 1-14)
-        if week <= REGULAR_SEASON_WEEKS:
-            if t1p > t2p:
-                team_stats[t1k]["wins"] += 1
-                team_stats[t2k]["losses"] += 1
-            elif t2p > t1p:
-                team_stats[t2k]["wins"] += 1
-                team_stats[t1k]["losses"] += 1
-            else:
-                team_stats[t1k]["ties"] += 1
-                team_stats[t2k]["ties"] += 1
-
-        # Always count points
-        team_stats[t1k]["pf"] += t1p
-        team_stats[t1k]["pa"] += t2p
-        team_stats[t2k]["pf"] += t2p
-        team_stats[t2k]["pa"] += t1p
-
-        # Track last game for each team
-        t1_owner = owner_map.get(t1k, "")
-        t2_owner = owner_map.get(t2k, "")
-        team_last_game[t1k] = {"week": week, "pts": t1p, "opp_pts": t2p, "opp": t2_owner}
-        team_last_game[t2k] = {"week": week, "pts": t2p, "opp_pts": t1p, "opp": t1_owner}
-
-    # Determine standings rank (by wins, then PF tiebreaker)
-    sorted_teams = sorted(team_stats.keys(),
-                          key=lambda tk: (team_stats[tk]["wins"], team_stats[tk]["pf"]),
-                          reverse=True)
-    standings_rank = {tk: i + 1 for i, tk in enumerate(sorted_teams)}
-
-    # PF and PA ranks
-    pf_sorted = sorted(team_stats.keys(), key=lambda tk: team_stats[tk]["pf"], reverse=True)
-    pa_sorted = sorted(team_stats.keys(), key=lambda tk: team_stats[tk]["pa"], reverse=True)  # most PA = rank 1
-    pf_rank = {tk: i + 1 for i, tk in enumerate(pf_sorted)}
-    pa_rank = {tk: i + 1 for i, tk in enumerate(pa_sorted)}
-
-    # Determine playoff finish from weeks 15-17
+    # Dense team ids in first-appearance order, plus last game per team.
+    # Playoff games (weeks 15-17) are bucketed by week in the same pass:
     # Week 15 = Quarterfinals (4 matchups, 8 teams)
     # Week 16 = Semifinals (2 championship bracket + 2 consolation)
     # Week 17 = Championship (1 champ game + consolation games)
+    team_ids = {}
+    team_last_game = {}  # team_key -> its last matchup row
     playoff_matchups = defaultdict(list)
+    qf_teams = set()  # teams in week 15
     for m in matchups:
-        if m["week"] > REGULAR_SEASON_WEEKS:
-            playoff_matchups[m["week"]].append(m)
-
-    # QF teams = teams in week 15
-    qf_teams = set()
-    for m in playoff_matchups.get(15, []):
-        qf_teams.add(m["team_1_key"])
-        qf_teams.add(m["team_2_key"])
+        t1k, t2k = m["team_1_key"], m["team_2_key"]
+        team_ids.setdefault(t1k, len(team_ids))
+        team_ids.setdefault(t2k, len(team_ids))
+        team_last_game[t1k] = team_last_game[t2k] = m
+        week = m["week"]
+        if week > REGULAR_SEASON_WEEKS:
+            playoff_matchups[week].append(m)
+            if week == 15:
+                qf_teams.add(t1k)
+                qf_teams.add(t2k)
+
+    team_keys = list(team_ids)
+    n_teams = len(team_keys)
+
+    # Compute W/L/PF/PA per team. Each game contributes one row per side,
+    # interleaved (team 1, team 2) so point sums accumulate in game order.
+    side = np.array([(team_ids[m["team_1_key"]], team_ids[m["team_2_key"]])
+                     for m in matchups]).ravel()
+    scores = np.array([(m["team_1_points"], m["team_2_points"]) for m in matchups],
+                      dtype=float)
+    pts, opp_pts = scores.ravel(), scores[:, ::-1].ravel()
+    weeks = np.repeat([m["week"] for m in matchups], 2)
+
+    wins, losses, ties, pf, pa = aggregate_records(side, pts, opp_pts, weeks, n_teams)
+
+    # Determine standings rank (by wins, then PF tiebreaker); lexsort is
+    # stable, so exact ties keep first-appearance order
+    standings_order = np.lexsort((-pf, -wins))
+    standings_rank = {team_keys[i]: rank
+                      for rank, i in enumerate(standings_order.tolist(), 1)}
+
+    # PF and PA ranks (most PA = rank 1)
+    pf_rank = {team_keys[i]: rank
+               for rank, i in enumerate(np.argsort(-pf, kind="stable").tolist(), 1)}
+    pa_rank = {team_keys[i]: rank
+               for rank, i in enumerate(np.argsort(-pa, kind="stable").tolist(), 1)}
 
+    # Determine playoff finish from weeks 15-17
     team_playoff_finish = {}
 
     # Track winners advancing through each round
@@ -243,7 +314,7 @@ def build_season_summaries(season, owner_map):
             team_playoff_finish[loser] = "Championship Loss"
 
     # Fill in remaining
-    for tk in team_stats:
+    for tk in team_keys:
         if tk not in team_playoff_finish:
             if tk in qf_teams:
                 team_playoff_finish[tk] = "Quarterfinal Loss"  # shouldn't happen
@@ -252,141 +323,154 @@ def build_season_summaries(season, owner_map):
 
     # Build summaries
     summaries = {}
-    for tk in team_stats:
-        s = team_stats[tk]
-        last = team_last_game.get(tk, {})
+    for i, tk in enumerate(team_keys):
+        last = team_last_game[tk]
+        us, them = ("1", "2") if last["team_1_key"] == tk else ("2", "1")
         summaries[tk] = {
-            "wins": s["wins"],
-            "losses": s["losses"],
-            "ties": s["ties"],
-            "pf": round(s["pf"], 2),
-            "pa": round(s["pa"], 2),
+            "wins": int(wins[i]),
+            "losses": int(losses[i]),
+            "ties": int(ties[i]),
+            "pf": round(float(pf[i]), 2),
+            "pa": round(float(pa[i]), 2),
             "pf_rank": pf_rank.get(tk, 0),
             "pa_rank": pa_rank.get(tk, 0),
             "standing": standings_rank.get(tk, 0),
             "playoff_finish": team_playoff_finish.get(tk, ""),
-            "last_game_pts": last.get("pts", 0),
-            "last_game_opp_pts": last.get("opp_pts", 0),
-            "last_game_opp": last.get("opp", ""),
+            "last_game_pts": last[f"team_{us}_points"],
+            "last_game_opp_pts": last[f"team_{them}_points"],
+            "last_game_opp": owner_map.get(last[f"team_{them}_key"], ""),
         }
 
     return summaries
 
 
-def build_rosters_data():
-    """Build rosters_data.json: per season+team, week 1 and final rosters + summary."""
-    result = {}
+def load_rosters():
+    """Load each season's rosters.json once so both builders can share it."""
+    return {season: load_json(os.path.join(YAHOO_DIR, season, "rosters.json"))
+            for season in SEASONS}
 
-    for season in SEASONS:
-        rosters = load_json(os.path.join(YAHOO_DIR, season, "rosters.json"))
-        if not rosters:
-            print(f"  {season}: no roster data, skipping")
-            continue
 
-        team_names = build_team_names(season)
-        owner_map = build_owner_map(season)
-        summaries = build_season_summaries(season, owner_map)
+def build_season_rosters(season, rosters):
+    """Build one season's rosters_data entry: per team week 1/final rosters + summary."""
+    team_names = build_team_names(season)
+    owner_map = build_owner_map(season)
+    summaries = build_season_summaries(season, owner_map)
+
+    # Determine position field name
+    pos_field = "display_position"
+    if rosters and pos_field not in rosters[0]:
+        pos_field = "eligible_positions"
+
+    # Group by team_key -> player_key -> [season points, bitmask of weeks rostered]
+    team_player_totals = defaultdict(dict)
+    player_info = {}  # player_key -> (name, pos), latest row wins
+    team_max_week = {}  # latest week with roster data per team
+    max_week = 0
+
+    for r in rosters:
+        tk = r["team_key"]
+        pk = r["player_key"]
+        week = r["week"]
+        players = team_player_totals[tk]
+        totals = players.get(pk)
+        if totals is None:
+            totals = players[pk] = [0, 0]
+        totals[0] += r.get("points", 0)
+        totals[1] |= 1 << week
+        player_info[pk] = (r.get("player_name", ""), r.get(pos_field, ""))
+        if week > team_max_week.get(tk, 0):
+            team_max_week[tk] = week
+        if week > max_week:
+            max_week = week
+
+    season_data = {"teams": {}, "max_week": max_week}
+
+    # For position ranks: pos -> [(season pts, roster entry)]
+    pos_totals = defaultdict(list)
+
+    for tk, players in team_player_totals.items():
+        owner = owner_map.get(tk, team_names.get(tk, tk))
+        week1_players = []
+        final_players = []
+        final_week = team_max_week.get(tk, max_week)
+        final_bit = 1 << final_week
+
+        for pk, (total_pts, week_mask) in players.items():
+            name, pos = player_info[pk]
+
+            entry = {
+                "name": name,
+                "pos": pos,
+                "pts": round(total_pts, 2),
+                "pos_rank": "",
+            }
 
-        # Determine position field name
-        pos_field = "display_position"
-        if rosters and pos_field not in rosters[0]:
-            pos_field = "eligible_positions"
+            if week_mask & (1 << 1):
+                week1_players.append(entry)
+            if week_mask & final_bit:
+                final_players.append(entry)
 
-        # Group by team_key -> player_key -> list of (week, points)
-        team_player_weeks = defaultdict(lambda: defaultdict(list))
-        player_info = {}
+            pos_totals[pos].append((total_pts, entry))
 
-        for r in rosters:
-            tk = r["team_key"]
-            pk = r["player_key"]
-            team_player_weeks[tk][pk].append({
-                "week": r["week"],
-                "points": r.get("points", 0),
-            })
-            player_info[pk] = {
-                "name": r.get("player_name", ""),
-                "pos": r.get(pos_field, ""),
-            }
+        week1_players.sort(key=itemgetter("pts"), reverse=True)
+        final_players.sort(key=itemgetter("pts"), reverse=True)
 
-        max_week = max(r["week"] for r in rosters)
-        season_data = {"teams": {}, "max_week": max_week}
+        season_data["teams"][tk] = {
+            "owner": owner,
+            "team_name": team_names.get(tk, tk),
+            "week1": week1_players,
+            "final": final_players,
+            "final_week": final_week,
+            "summary": summaries.get(tk, {}),
+        }
 
-        # For position ranks
-        pos_totals = defaultdict(list)
+    # Compute position ranks league-wide (skill positions only). A player
+    # traded mid-season is ranked separately on each team's roster.
+    for pos, entries in pos_totals.items():
+        if pos not in SKILL_POSITIONS:
+            continue
+        pts = np.fromiter((e[0] for e in entries), dtype=float, count=len(entries))
+        for rank, i in enumerate(np.argsort(-pts, kind="stable").tolist(), 1):
+            entries[i][1]["pos_rank"] = f"{pos}{rank}"
+
+    return season_data
 
-        # Find the latest week with roster data per team
-        team_max_week = {}
-        for r in rosters:
-            tk = r["team_key"]
-            team_max_week[tk] = max(team_max_week.get(tk, 0), r["week"])
-
-        for tk, players in team_player_weeks.items():
-            owner = owner_map.get(tk, team_names.get(tk, tk))
-            week1_players = []
-            final_players = []
-            final_week = team_max_week.get(tk, max_week)
-
-            for pk, weeks in players.items():
-                info = player_info[pk]
-                total_pts = sum(w["points"] for w in weeks)
-                week_nums = {w["week"] for w in weeks}
-
-                entry = {
-                    "name": info["name"],
-                    "pos": info["pos"],
-                    "pts": round(total_pts, 2),
-                }
-
-                if 1 in week_nums:
-                    week1_players.append(entry)
-                if final_week in week_nums:
-                    final_players.append(entry)
-
-                if info["pos"] in SKILL_POSITIONS:
-                    pos_totals[info["pos"]].append((info["name"], total_pts, tk))
-
-            week1_players.sort(key=lambda p: p["pts"], reverse=True)
-            final_players.sort(key=lambda p: p["pts"], reverse=True)
-
-            season_data["teams"][tk] = {
-                "owner": owner,
-                "team_name": team_names.get(tk, tk),
-                "week1": week1_players,
-                "final": final_players,
-                "final_week": final_week,
-                "summary": summaries.get(tk, {}),
-            }
 
-        # Compute position ranks league-wide
-        pos_ranks = {}
-        for pos, entries in pos_totals.items():
-            sorted_entries = sorted(entries, key=lambda x: x[1], reverse=True)
-            for rank, (name, pts, tk) in enumerate(sorted_entries, 1):
-                pos_ranks[(name, tk)] = f"{pos}{rank}"
+def build_rosters_data(rosters_by_season):
+    """Build rosters_data.json: per season+team, week 1 and final rosters + summary.
+
+    Seasons are independent (see build_season_rosters), but each takes only a
+    few milliseconds, so they run serially; a process pool costs more to start
+    than the work it would spread out.
+    """
+    result = {}
 
-        for tk, team_data in season_data["teams"].items():
-            for roster_list in [team_data["week1"], team_data["final"]]:
-                for p in roster_list:
-                    p["pos_rank"] = pos_ranks.get((p["name"], tk), "")
+    for season in SEASONS:
+        rosters = rosters_by_season.get(season)
+        if not rosters:
+            print(f"  {season}: no roster data, skipping")
+            continue
 
+        season_data = build_season_rosters(season, rosters)
         result[season] = season_data
         team_count = len(season_data["teams"])
-        print(f"  {season}: {team_count} teams, weeks 1-{max_week}")
+        print(f"  {season}: {team_count} teams, weeks 1-{season_data['max_week']}")
 
     return result
 
 
-def build_draft_value():
+def build_draft_value(rosters_by_season):
     """Build draft_value.json: per season, drafted players with value scores."""
     result = {}
 
     # First pass: pool all seasons to train a single model per position
-    pooled_pos_players = defaultdict(list)
+    pooled_cost = defaultdict(list)  # pos -> costs of paid, scoring picks
+    pooled_pts = defaultdict(list)  # pos -> matching season points
     season_data_cache = {}
 
     for season in SEASONS:
         draft = load_json(os.path.join(YAHOO_DIR, season, "draft.json"))
-        rosters = load_json(os.path.join(YAHOO_DIR, season, "rosters.json"))
+        rosters = rosters_by_season.get(season)
 
         if not draft or not rosters:
             print(f"  {season}: missing draft or roster data, skipping")
@@ -416,17 +500,19 @@ def build_draft_value():
             pts = player_season_pts.get(pk, 0)
             pos = player_pos.get(pk, "")
             if pos in DRAFT_VALUE_POSITIONS and cost > 0 and pts > 0:
-                pooled_pos_players[pos].append({"cost": cost, "pts": pts})
+                pooled_cost[pos].append(cost)
+                pooled_pts[pos].append(pts)
 
     # Train pooled model: power regression (cost^0.7) on starters across all years
     pos_models = {}
-    for pos, players in pooled_pos_players.items():
+    for pos, pos_costs in pooled_cost.items():
         threshold = STARTER_THRESHOLDS.get(pos, 16) * len(season_data_cache)
-        starters = sorted(players, key=lambda p: p["pts"], reverse=True)[:threshold]
-        cheap = [p for p in players if p["cost"] <= 2]
+        costs = np.fromiter(pos_costs, dtype=float, count=len(pos_costs))
+        pts = np.fromiter(pooled_pts[pos], dtype=float, count=len(pos_costs))
+        # Stable sort so ties at the starter cutoff keep input order
+        starters = np.argsort(-pts, kind="stable")[:threshold]
+        costs, pts = costs[starters], pts[starters]
 
-        costs = np.array([p["cost"] for p in starters], dtype=float)
-        pts = np.array([p["pts"] for p in starters])
         coeffs = np.polyfit(np.power(costs, 0.7), pts, 1)
 
         pos_models[pos] = {"a": float(coeffs[0]), "b": float(coeffs[1])}
@@ -442,40 +528,44 @@ def build_draft_value():
         cached = season_data_cache[season]
         owner_map = build_owner_map(season)
 
+        drafted = [d for d in cached["draft"]
+                   if cached["player_pos"].get(d["player_key"], "") in pos_models]
+        positions = [cached["player_pos"][d["player_key"]] for d in drafted]
+        costs = np.array([d.get("cost", 0) or 0 for d in drafted], dtype=float)
+        total_pts = np.array([cached["player_season_pts"].get(d["player_key"], 0)
+                              for d in drafted], dtype=float)
+
+        # Evaluate the position models for every drafted player at once
+        a = np.array([pos_models[pos]["a"] for pos in positions])
+        b = np.array([pos_models[pos]["b"] for pos in positions])
+        raw = a * np.power(costs, 0.7) + b
+        expected = np.maximum(raw, 0)
+        # Cap expected pts for dart throws ($1-3) so misses aren't over-penalized
+        capped = (costs <= 3) & (expected > 80)
+        expected = np.where(capped, 80, expected)
+        # $0 picks get no expectation and no value
+        paid = costs > 0
+        expected = np.where(paid, expected, 0)
+        value = np.where(paid, total_pts - expected, 0)
+        # Floored, capped and $0 expectations stay ints (0 / 80) in the JSON
+        whole = ~paid | (raw < 0) | capped
+
         entries = []
-        for d in cached["draft"]:
-            pk = d["player_key"]
-            cost = d.get("cost", 0) or 0
-            total_pts = cached["player_season_pts"].get(pk, 0)
-            pos = cached["player_pos"].get(pk, "")
+        for d, pos, pts, exp, val, is_paid, is_whole in zip(
+                drafted, positions, total_pts.tolist(), expected.tolist(),
+                value.tolist(), paid.tolist(), whole.tolist()):
             tk = d.get("team_key", "")
-
-            if pos not in pos_models:
-                continue
-
-            model = pos_models[pos]
-            if cost > 0:
-                expected_pts = model["a"] * np.power(float(cost), 0.7) + model["b"]
-                expected_pts = max(float(expected_pts), 0)
-                # Cap expected pts for dart throws ($1-3) so misses aren't over-penalized
-                if cost <= 3:
-                    expected_pts = min(expected_pts, 80)
-                value = round(total_pts - expected_pts, 1)
-            else:
-                expected_pts = 0
-                value = 0
-
             entries.append({
                 "player": d.get("player_name", "Unknown"),
                 "pos": pos,
                 "owner": owner_map.get(tk, d.get("team_name", "")),
-                "cost": cost,
-                "pts": round(total_pts, 2),
-                "expected": round(expected_pts, 1),
-                "value": value,
+                "cost": d.get("cost", 0) or 0,
+                "pts": round(pts, 2),
+                "expected": int(exp) if is_whole else round(exp, 1),
+                "value": round(val, 1) if is_paid else 0,
             })
 
-        entries.sort(key=lambda e: e["value"], reverse=True)
+        entries.sort(key=itemgetter("value"), reverse=True)
         owners = sorted(set(e["owner"] for e in entries))
 
         result[season] = {
@@ -489,20 +579,21 @@ def build_draft_value():
 
 
 def main():
+    pretty = "--pretty" in sys.argv[1:]
     print("=== Building Roster & Draft Value Data ===\n")
 
+    rosters_by_season = load_rosters()
+
     print("Building rosters data...")
-    rosters_data = build_rosters_data()
+    rosters_data = build_rosters_data(rosters_by_season)
     out_path = os.path.join(SITE_DATA, "rosters_data.json")
-    with open(out_path, "w") as f:
-        json.dump(rosters_data, f, indent=2)
+    dump_json(rosters_data, out_path, pretty)
     print(f"  Saved: {out_path}\n")
 
     print("Building draft value data...")
-    draft_value = build_draft_value()
+    draft_value = build_draft_value(rosters_by_season)
     out_path = os.path.join(SITE_DATA, "draft_value.json")
-    with open(out_path, "w") as f:
-        json.dump(draft_value, f, indent=2)
+    dump_json(draft_value, out_path, pretty)
     print(f"  Saved: {out_path}\n")
 
     print("Done!")
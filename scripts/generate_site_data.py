@@ -1,4 +1,9 @@
-"""Master script: parse all PDFs and generate JSON data + HTML content for the site."""
+"""Master script: parse all PDFs and generate JSON data + HTML content for the site.
+
+Usage:  python3 scripts/generate_site_data.py [--pretty]
+JSON output is compact (it is only read by the site's JS); --pretty writes
+2-space indented files for inspecting by hand.
+"""
 
 import os
 import sys
@@ -6,6 +11,13 @@ import json
 import re
 import html
 from collections import defaultdict
+from functools import lru_cache
+
+# orjson is much faster for the JSON dumps; fall back to the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 sys.path.insert(0, os.path.dirname(__file__))
 from pdf_parser import extract_full_text, extract_images, parse_filename
@@ -21,6 +33,9 @@ IMG_DIR = os.path.join(SITE_DIR, "images")
 os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs(IMG_DIR, exist_ok=True)
 
+# Chart/screenshot embed used for week images
+ARTICLE_IMAGE_HTML = '<div class="article-image"><img src="images/{}" alt="Chart" loading="lazy"></div>'
+
 # ===== IMAGE OVERRIDES =====
 # Images to skip entirely (by filename substring match)
 SKIP_IMAGES = {
@@ -167,22 +182,19 @@ def get_week_id(file_info):
 
 def _render_power_trios_table(data):
     """Render power trios data as an HTML table."""
-    rows = ""
-    for team, p1, p2, p3, total in data:
-        rows += f"<tr><td>{html.escape(team)}</td><td>{html.escape(p1)}</td><td>{html.escape(p2)}</td><td>{html.escape(p3)}</td><td><strong>{total}</strong></td></tr>\n"
+    rows = "".join(
+        f"<tr><td>{html.escape(team)}</td><td>{html.escape(p1)}</td><td>{html.escape(p2)}</td><td>{html.escape(p3)}</td><td><strong>{total}</strong></td></tr>\n"
+        for team, p1, p2, p3, total in data)
     return f'''<table class="odds-table">
 <thead><tr><th>Team</th><th>Player 1</th><th>Player 2</th><th>Player 3</th><th>Total</th></tr></thead>
 <tbody>{rows}</tbody>
 </table>'''
 
 
-_trios_chart_counter = 0
-
 def _render_power_trios_chart(data, week_id):
     """Render power trios data as an inline Chart.js horizontal bar chart."""
-    global _trios_chart_counter
-    _trios_chart_counter += 1
-    canvas_id = f"trios-chart-{week_id}-{_trios_chart_counter}"
+    # The chart is injected at most once per week, so the week id is unique
+    canvas_id = f"trios-chart-{week_id}"
 
     # Build JS data arrays
     labels = json.dumps([team for team, *_ in data])
@@ -231,27 +243,31 @@ def _render_power_trios_chart(data, week_id):
 </script>'''
 
 
+# Known Player Assessment statuses, longest first so "hurt but also zaukas"
+# wins over "hurt" at the same position
+PLAYER_STATUSES = tuple(sorted((
+    "prison", "hurt", "zoo", "zoo animal", "credit", "not bad", "good",
+    "bad", "mid", "clean", "ascending", "retire already", "my hair",
+    "stop the cap", "feed the beast", "zaukas", "boyle", "soon",
+    "hurt but also zaukas", "just stop", "prison but good", "wdhdi",
+    "cooked", "injured", "stinks", "decent",
+), key=len, reverse=True))
+
+# Match "Player Assessment ..." or "Player Status ..." blocks
+PLAYER_ASSESSMENT_RE = re.compile(
+    r'(Player (?:Assessment|Status))\s+(.+?)(?=</p>|$)',
+    re.IGNORECASE
+)
+
+
 def _convert_player_assessment(text):
     """Convert 'Player Assessment/Status' text blocks to HTML tables."""
-    # Match "Player Assessment ..." or "Player Status ..." blocks
-    pattern = re.compile(
-        r'(Player (?:Assessment|Status))\s+(.+?)(?=</p>|$)',
-        re.IGNORECASE
-    )
 
     def _parse_roster(match):
         label = match.group(1)
         rest = match.group(2).strip()
         # Known player name patterns: first name + last name(s)
         # Split by detecting Name Status Name Status pattern
-        # Use a heuristic: capitalize words that start player names
-        known_statuses = {
-            "prison", "hurt", "zoo", "zoo animal", "credit", "not bad", "good",
-            "bad", "mid", "clean", "ascending", "retire already", "my hair",
-            "stop the cap", "feed the beast", "zaukas", "boyle", "soon",
-            "hurt but also zaukas", "just stop", "prison but good", "wdhdi",
-            "cooked", "injured", "stinks", "decent",
-        }
         # Try to pair up: every other token is a name/status
         # Split on known status words
         entries = []
@@ -259,8 +275,9 @@ def _convert_player_assessment(text):
         while remaining.strip():
             # Try to find next player name + status pair
             best_match = None
-            for status in sorted(known_statuses, key=len, reverse=True):
-                idx = remaining.lower().find(status.lower())
+            remaining_lower = remaining.lower()
+            for status in PLAYER_STATUSES:
+                idx = remaining_lower.find(status)
                 if idx > 0:  # status found after some player name text
                     name = remaining[:idx].strip()
                     if name and len(name) > 2:
@@ -279,16 +296,31 @@ def _convert_player_assessment(text):
         rows = "".join(f"<tr><td>{html.escape(n)}</td><td>{html.escape(s)}</td></tr>" for n, s in entries)
         return f'</p><table class="odds-table"><thead><tr><th>Player</th><th>Status</th></tr></thead><tbody>{rows}</tbody></table><p>'
 
-    return pattern.sub(_parse_roster, text)
+    return PLAYER_ASSESSMENT_RE.sub(_parse_roster, text)
+
+
+# Inline odds table: "Team Playoff odds Championship odds Relegation odds TeamName value value value ..."
+INLINE_ODDS_HEADER_RE = re.compile(
+    r'(Team\s+Playoff odds\s+Championship odds\s+Relegation odds)\s+',
+    re.IGNORECASE
+)
+# Any capitalized multi-word team name directly followed by an odds value
+INLINE_ODDS_TEAM_RE = re.compile(r'([A-Z][\w\s\'\.]+?)(?=\s+(?:clinched|off the board|[+\-]\d))')
+INLINE_ODDS_VALUE_RE = re.compile(r'(clinched|off the board|off board|[+\-]?\d+)\s*', re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _inline_odds_team_names():
+    """(known team names longest first, those plus lowercased owner names)."""
+    from ranking_parser import TEAM_OWNER_MAP
+    from owner_mapping import ALL_OWNERS
+    team_names = tuple(sorted(TEAM_OWNER_MAP.keys(), key=len, reverse=True))
+    return team_names, team_names + tuple(n.lower() for n in ALL_OWNERS)
 
 
 def _convert_inline_odds_table(text):
     """Detect and convert inline odds table text (Team odds odds odds ...) to HTML table."""
-    # Pattern: "Team Playoff odds Championship odds Relegation odds TeamName value value value ..."
-    header_match = re.search(
-        r'(Team\s+Playoff odds\s+Championship odds\s+Relegation odds)\s+',
-        text, re.IGNORECASE
-    )
+    header_match = INLINE_ODDS_HEADER_RE.search(text)
     if not header_match:
         return text
 
@@ -297,23 +329,21 @@ def _convert_inline_odds_table(text):
     table_text = text[header_match.end():].strip()
 
     # Known team names to split on
-    from ranking_parser import TEAM_OWNER_MAP
-    from owner_mapping import ALL_OWNERS
-    all_team_names = sorted(TEAM_OWNER_MAP.keys(), key=len, reverse=True)
-    all_team_names += [n.lower() for n in ALL_OWNERS]
+    team_names, all_team_names = _inline_odds_team_names()
 
     # Parse rows: team name followed by 3 values
     rows = []
     remaining = table_text
     while remaining.strip():
         best_match = None
+        remaining_lower = remaining.lower()
         for tname in all_team_names:
-            if remaining.lower().startswith(tname):
+            if remaining_lower.startswith(tname):
                 if best_match is None or len(tname) > len(best_match):
                     best_match = tname
         if not best_match:
             # Try matching any capitalized multi-word team name
-            m = re.match(r'([A-Z][\w\s\'\.]+?)(?=\s+(?:clinched|off the board|[+\-]\d))', remaining)
+            m = INLINE_ODDS_TEAM_RE.match(remaining)
             if m:
                 best_match = m.group(1).strip().lower()
             else:
@@ -322,8 +352,8 @@ def _convert_inline_odds_table(text):
         # Extract team name (use original case)
         team_display = remaining[:len(best_match)].strip()
         # Try to get proper case from original
-        for tname in sorted(TEAM_OWNER_MAP.keys(), key=len, reverse=True):
-            if remaining.lower().startswith(tname):
+        for tname in team_names:
+            if remaining_lower.startswith(tname):
                 team_display = remaining[:len(tname)]
                 break
         remaining = remaining[len(best_match):].strip()
@@ -331,7 +361,7 @@ def _convert_inline_odds_table(text):
         # Extract 3 values (clinched, +/-NNN, off board, off the board)
         vals = []
         for _ in range(3):
-            val_m = re.match(r'(clinched|off the board|off board|[+\-]?\d+)\s*', remaining, re.IGNORECASE)
+            val_m = INLINE_ODDS_VALUE_RE.match(remaining)
             if val_m:
                 vals.append(val_m.group(1))
                 remaining = remaining[val_m.end():]
@@ -343,10 +373,11 @@ def _convert_inline_odds_table(text):
     if not rows:
         return text
 
-    table_html = '<table class="odds-table"><thead><tr><th>Team</th><th>Playoff Odds</th><th>Championship Odds</th><th>Relegation Odds</th></tr></thead><tbody>'
+    table_parts = ['<table class="odds-table"><thead><tr><th>Team</th><th>Playoff Odds</th><th>Championship Odds</th><th>Relegation Odds</th></tr></thead><tbody>']
     for team, playoff, champ, releg in rows:
-        table_html += f'<tr><td>{html.escape(team)}</td><td>{html.escape(playoff)}</td><td>{html.escape(champ)}</td><td>{html.escape(releg)}</td></tr>'
-    table_html += '</tbody></table>'
+        table_parts.append(f'<tr><td>{html.escape(team)}</td><td>{html.escape(playoff)}</td><td>{html.escape(champ)}</td><td>{html.escape(releg)}</td></tr>')
+    table_parts.append('</tbody></table>')
+    table_html = "".join(table_parts)
 
     before_html = f'<p>{html.escape(before)}</p>' if before else ''
     return before_html + table_html
@@ -376,6 +407,9 @@ def _render_bullets(items):
     return "".join(parts)
 
 
+SUB_BULLET_RE = re.compile(r'^o\s+\S')
+
+
 def _blocks_to_html(text):
     """Line-aware renderer: flowing paragraphs plus nested bullet lists
     (lines beginning with a bullet char are top-level, "o " lines are sub-items)."""
@@ -399,7 +433,7 @@ def _blocks_to_html(text):
             flush_para(); flush_list(); continue
         if s[0] in "•▪●":          # • ▪ ●
             flush_para(); items.append((0, s[1:].strip()))
-        elif re.match(r'^o\s+\S', s):              # "o " sub-bullet
+        elif SUB_BULLET_RE.match(s):               # "o " sub-bullet
             flush_para(); items.append((1, s[1:].strip()))
         else:
             flush_list(); para.append(s)
@@ -407,9 +441,16 @@ def _blocks_to_html(text):
     return "\n".join(out)
 
 
+# Blank line(s) between paragraphs
+PARA_SPLIT_RE = re.compile(r'\n\s*\n')
+
+
+@lru_cache(maxsize=None)
 def writeup_to_html(text, bullets=False):
     """Convert plain text writeup to HTML. With bullets=True, "•"/"o" line
-    markers become a nested list instead of being flattened into a paragraph."""
+    markers become a nested list instead of being flattened into a paragraph.
+
+    Cached: boilerplate intros and section text recur across weeks."""
     if not text:
         return ""
     # Escape HTML entities
@@ -420,14 +461,14 @@ def writeup_to_html(text, bullets=False):
 
     # Fix PDF page-break artifacts: merge paragraphs where the second part
     # starts with a lowercase letter (indicating mid-sentence split)
-    paragraphs = re.split(r'\n\s*\n', text)
+    paragraphs = PARA_SPLIT_RE.split(text)
     merged = []
     for p in paragraphs:
         p = p.strip()
         if not p:
             continue
         # Join lines within paragraph
-        p = re.sub(r'\n', ' ', p)
+        p = p.replace('\n', ' ')
         # Merge with previous if this starts with lowercase (page break artifact)
         if merged and p and p[0].islower():
             merged[-1] += " " + p
@@ -442,41 +483,48 @@ def writeup_to_html(text, bullets=False):
     return result
 
 
-def subsection_to_html(key, value):
-    """Convert a subsection to an HTML callout box."""
-    labels = {
-        "next_up": ("Next Up", "next-up"),
-        "draft_steal": ("Draft Steal", "draft-steal"),
-        "draft_bust": ("Draft Bust", "draft-bust"),
-        "best_pick": ("Best Pick", "best-pick"),
-        "worst_pick": ("Worst Pick", "worst-pick"),
-        "general_strategy": ("General Strategy", "strategy"),
-        "x_factors": ("X-Factors", "x-factors"),
-        "pick": ("The Pick", "pick"),
-        "playoff_scenario": ("Playoff Scenario", "playoff"),
-        "best_move": ("Best Move", "best-pick"),
-        "predicted_finish": ("Predicted Finish", "pick"),
-        "sleeper": ("Sleeper", "draft-steal"),
-        "a_chirp": ("A Chirp", "worst-pick"),
-        "looking_ahead": ("Looking Ahead", "next-up"),
-        "midseason_draft_checkin": ("Midseason Draft Check-in", "strategy"),
-        "newark_street_stat": ("Newark Street Stat", "x-factors"),
-        "nervous_about": ("Nervous About", "worst-pick"),
-        "best_draft_pick": ("Best Draft Pick", "best-pick"),
-        "reason_for_optimism": ("Reason for Optimism", "draft-steal"),
-        "algorithm_roster_suggestion": ("Algorithm's Roster Suggestion", "strategy"),
-    }
+# Subsection key -> (callout label, css class)
+SUBSECTION_LABELS = {
+    "next_up": ("Next Up", "next-up"),
+    "draft_steal": ("Draft Steal", "draft-steal"),
+    "draft_bust": ("Draft Bust", "draft-bust"),
+    "best_pick": ("Best Pick", "best-pick"),
+    "worst_pick": ("Worst Pick", "worst-pick"),
+    "general_strategy": ("General Strategy", "strategy"),
+    "x_factors": ("X-Factors", "x-factors"),
+    "pick": ("The Pick", "pick"),
+    "playoff_scenario": ("Playoff Scenario", "playoff"),
+    "best_move": ("Best Move", "best-pick"),
+    "predicted_finish": ("Predicted Finish", "pick"),
+    "sleeper": ("Sleeper", "draft-steal"),
+    "a_chirp": ("A Chirp", "worst-pick"),
+    "looking_ahead": ("Looking Ahead", "next-up"),
+    "midseason_draft_checkin": ("Midseason Draft Check-in", "strategy"),
+    "newark_street_stat": ("Newark Street Stat", "x-factors"),
+    "nervous_about": ("Nervous About", "worst-pick"),
+    "best_draft_pick": ("Best Draft Pick", "best-pick"),
+    "reason_for_optimism": ("Reason for Optimism", "draft-steal"),
+    "algorithm_roster_suggestion": ("Algorithm's Roster Suggestion", "strategy"),
+}
+
+
+@lru_cache(maxsize=None)
+def _subsection_label(key):
+    """Callout (label, css class) for a subsection key."""
     # Handle team_comp_ prefixed keys
     if key.startswith("team_comp_"):
-        comp_label = key.replace("team_comp_", "").replace("_", " ")
-        label, css_class = comp_label, "strategy"
-    elif key.startswith("pick_"):
+        return key.replace("team_comp_", "").replace("_", " "), "strategy"
+    if key.startswith("pick_"):
         # Per-team pick labels (e.g. "pick_scampi_best_pick")
         pick_label = key.replace("pick_", "").replace("_", " ").title()
-        css_class = "best-pick" if "best" in key else "worst-pick"
-        label, css_class = pick_label, css_class
-    else:
-        label, css_class = labels.get(key, (key.replace("_", " ").title(), key))
+        return pick_label, "best-pick" if "best" in key else "worst-pick"
+    return SUBSECTION_LABELS.get(key, (key.replace("_", " ").title(), key))
+
+
+@lru_cache(maxsize=None)
+def subsection_to_html(key, value):
+    """Convert a subsection to an HTML callout box."""
+    label, css_class = _subsection_label(key)
     escaped = html.escape(value)
     return f'<div class="callout callout-{css_class}"><span class="callout-label">{label}:</span> {escaped}</div>'
 
@@ -493,31 +541,34 @@ def merge_grouped_teams(parsed):
     if len(teams) < 2:
         return
 
-    merged = []
-    i = 0
-    while i < len(teams):
-        team = teams[i]
-        # Check if this team has no writeup and next team does
-        if not team.get("writeup", "").strip() and not team.get("subsections"):
-            # Collect consecutive empty-writeup teams
-            group = [team]
-            j = i + 1
-            while j < len(teams) and not teams[j].get("writeup", "").strip() and not teams[j].get("subsections"):
-                group.append(teams[j])
-                j += 1
-            # The next team (at index j) should have the shared writeup
-            if j < len(teams) and teams[j].get("writeup", "").strip():
-                group.append(teams[j])
-                # Mark as grouped: the last team in the group has the writeup
-                for g in group:
-                    g["grouped_with"] = [t["team_name"] for t in group if t != g]
-                merged.extend(group)
-                i = j + 1
-                continue
-        merged.append(team)
-        i += 1
-
-    parsed["teams"] = merged
+    has_writeup = [bool(t.get("writeup", "").strip()) for t in teams]
+    run_start = None  # index of the first team in the current run of empty cards
+    for i, team in enumerate(teams):
+        if not has_writeup[i] and not team.get("subsections"):
+            if run_start is None:
+                run_start = i
+            continue
+        # The team after a run of empty cards should have the shared writeup
+        if run_start is not None and has_writeup[i]:
+            group = teams[run_start:i + 1]
+            names = [t["team_name"] for t in group]
+            # Mark as grouped: the last team in the group has the writeup
+            for k, g in enumerate(group):
+                g["grouped_with"] = names[:k] + names[k + 1:]
+        run_start = None
+
+
+@lru_cache(maxsize=None)
+def _owner_suffix_patterns():
+    """Compiled (dash/colon suffix, "(Owner)" suffix) patterns per owner name, longest first."""
+    from owner_mapping import OWNER_CONSOLIDATION, ALL_OWNERS
+    owner_names = set(n.lower() for n in ALL_OWNERS)
+    owner_names.update(OWNER_CONSOLIDATION.keys())
+    return tuple(
+        (re.compile(r'[-:]\s*' + re.escape(oname) + r'[-.\s]*$', re.IGNORECASE),
+         re.compile(r'\s*\(' + re.escape(oname) + r'\)\s*$', re.IGNORECASE))
+        for oname in sorted(owner_names, key=len, reverse=True)
+    )
 
 
 def _clean_team_display_name(name, owner):
@@ -525,18 +576,15 @@ def _clean_team_display_name(name, owner):
     if not owner:
         return name
     from ranking_parser import TEAM_OWNER_MAP, _normalize_team_name
-    from owner_mapping import OWNER_CONSOLIDATION, ALL_OWNERS
-    owner_names = set(n.lower() for n in ALL_OWNERS)
-    owner_names.update(OWNER_CONSOLIDATION.keys())
 
     # First try stripping "(Owner)" or "- Owner" suffixes
-    for oname in sorted(owner_names, key=len, reverse=True):
+    for suffix_re, paren_re in _owner_suffix_patterns():
         # "Team- Owner" or "Team: Owner" pattern
-        cleaned = re.sub(r'[-:]\s*' + re.escape(oname) + r'[-.\s]*$', '', name, flags=re.IGNORECASE).strip()
+        cleaned = suffix_re.sub('', name).strip()
         if cleaned and cleaned != name:
             return cleaned
         # "(Owner)" pattern at end
-        cleaned = re.sub(r'\s*\(' + re.escape(oname) + r'\)\s*$', '', name, flags=re.IGNORECASE).strip()
+        cleaned = paren_re.sub('', name).strip()
         if cleaned and cleaned != name:
             return cleaned
 
@@ -548,12 +596,44 @@ def _clean_team_display_name(name, owner):
     return name
 
 
+@lru_cache(maxsize=None)
+def _escape(text):
+    """html.escape for short strings that recur every week (owners, team and tier names)."""
+    return html.escape(text)
+
+
 def _display_team_name(team_name, owner, season):
     """Canonical team name for the season/owner if known, else best-effort cleanup."""
     from owner_mapping import canonical_team
     return canonical_team(season, owner) or _clean_team_display_name(team_name, owner)
 
 
+# Card styling by rank: four tiers of four, plus special #1 / #16 treatment
+TIER_CLASSES = ("tier-1",) * 4 + ("tier-2",) * 4 + ("tier-3",) * 4 + ("tier-4",) * 4
+RANK_CLASSES = {1: "rank rank-first", 16: "rank rank-last"}
+RANK_ICONS = {
+    1: '<span class="icon-fire" title="Number One">&#128293;</span>',
+    16: '<span class="icon-skull" title="Last Place">&#128128;</span>',
+}
+
+
+@lru_cache(maxsize=None)
+def _movement_html(movement):
+    """Up/down/same badge for a week-over-week rank change (None → no badge)."""
+    if movement is None:
+        return ""
+    if movement > 0:
+        return f'<span class="movement up" title="Up {movement}">&#9650; {movement}</span>'
+    if movement < 0:
+        return f'<span class="movement down" title="Down {abs(movement)}">&#9660; {abs(movement)}</span>'
+    return '<span class="movement same">&#8212;</span>'
+
+
+def _tier_class(rank):
+    """Tier class for a rank; ranks outside 1-16 clamp to the nearest tier."""
+    return TIER_CLASSES[min(max(rank, 1), 16) - 1]
+
+
 def _grouped_team_to_html(leader, all_teams, week_id):
     """Render a group of tied/combined teams as a single card."""
     grouped_names = leader.get("grouped_with", [])
@@ -564,41 +644,29 @@ def _grouped_team_to_html(leader, all_teams, week_id):
     group_teams.sort(key=lambda t: (t is leader, t["rank"]))
 
     rank = leader["rank"]
-    tier_class = "tier-1" if rank <= 4 else "tier-2" if rank <= 8 else "tier-3" if rank <= 12 else "tier-4"
+    tier_class = _tier_class(rank)
 
     # Build headers for all teams in the group
-    headers_html = ""
+    header_parts = []
     for t in group_teams:
-        t_name = html.escape(_display_team_name(t["team_name"], t["owner"], (week_id or "")[:4]))
-        t_owner = html.escape(t["owner"])
+        t_name = _escape(_display_team_name(t["team_name"], t["owner"], (week_id or "")[:4]))
+        t_owner = _escape(t["owner"])
         t_rank = t["rank"]
-        rank_class = "rank"
-        if t_rank == 1:
-            rank_class += " rank-first"
-        elif t_rank == 16:
-            rank_class += " rank-last"
-        movement_html = ""
-        movement = t.get("computed_movement")
-        if movement is not None:
-            if movement > 0:
-                movement_html = f'<span class="movement up" title="Up {movement}">&#9650; {movement}</span>'
-            elif movement < 0:
-                movement_html = f'<span class="movement down" title="Down {abs(movement)}">&#9660; {abs(movement)}</span>'
-            else:
-                movement_html = '<span class="movement same">&#8212;</span>'
-        headers_html += f'''  <div class="team-header" id="{week_id}-rank-{t_rank}">
+        rank_class = RANK_CLASSES.get(t_rank, "rank")
+        movement_html = _movement_html(t.get("computed_movement"))
+        header_parts.append(f'''  <div class="team-header" id="{week_id}-rank-{t_rank}">
     <div class="{rank_class}">{t_rank}</div>
     <div class="team-info">
       <div class="team-owner">{t_owner}</div>
       <div class="team-name">{t_name}</div>
     </div>
     {movement_html}
-  </div>\n'''
+  </div>\n''')
+    headers_html = "".join(header_parts)
 
     writeup = writeup_to_html(leader["writeup"])
-    subsections_html = ""
-    for key, value in leader.get("subsections", {}).items():
-        subsections_html += subsection_to_html(key, value)
+    subsections_html = "".join(subsection_to_html(key, value)
+                               for key, value in leader.get("subsections", {}).items())
 
     return f'''<div class="team-card {tier_class}" data-rank="{rank}">
 {headers_html}  <div class="team-writeup">
@@ -611,49 +679,21 @@ def _grouped_team_to_html(leader, all_teams, week_id):
 def team_to_html(team, week_id, inline_images=None):
     """Convert a team entry to HTML card."""
     rank = team["rank"]
-    name = html.escape(_display_team_name(team["team_name"], team["owner"], (week_id or "")[:4]))
-    owner = html.escape(team["owner"])
+    name = _escape(_display_team_name(team["team_name"], team["owner"], (week_id or "")[:4]))
+    owner = _escape(team["owner"])
     writeup = writeup_to_html(team["writeup"])
 
     # Movement indicator (computed from previous week)
-    movement_html = ""
-    movement = team.get("computed_movement")
-    if movement is not None:
-        if movement > 0:
-            movement_html = f'<span class="movement up" title="Up {movement}">&#9650; {movement}</span>'
-        elif movement < 0:
-            movement_html = f'<span class="movement down" title="Down {abs(movement)}">&#9660; {abs(movement)}</span>'
-        else:
-            movement_html = '<span class="movement same">&#8212;</span>'
-
-    # Special rank styling
-    rank_class = "rank"
-    if rank == 1:
-        rank_class += " rank-first"
-    elif rank == 16:
-        rank_class += " rank-last"
-
-    # Tier color class (always assign based on rank)
-    if rank <= 4:
-        tier_class = "tier-1"
-    elif rank <= 8:
-        tier_class = "tier-2"
-    elif rank <= 12:
-        tier_class = "tier-3"
-    else:
-        tier_class = "tier-4"
+    movement_html = _movement_html(team.get("computed_movement"))
 
-    # Icons
-    icons = ""
-    if rank == 1:
-        icons = '<span class="icon-fire" title="Number One">&#128293;</span>'
-    if rank == 16:
-        icons = '<span class="icon-skull" title="Last Place">&#128128;</span>'
+    # Special rank styling, tier color class (always assigned) and icons
+    rank_class = RANK_CLASSES.get(rank, "rank")
+    tier_class = _tier_class(rank)
+    icons = RANK_ICONS.get(rank, "")
 
     # Subsections
-    subsections_html = ""
-    for key, value in team.get("subsections", {}).items():
-        subsections_html += subsection_to_html(key, value)
+    subsections_html = "".join(subsection_to_html(key, value)
+                               for key, value in team.get("subsections", {}).items())
 
     # Grouped teams: if this team has no writeup but is grouped, skip rendering
     # (it will be rendered as part of the group leader's card)
@@ -661,10 +701,8 @@ def team_to_html(team, week_id, inline_images=None):
     if grouped and not writeup and not subsections_html:
         return ""  # Will be included in the grouped card below
 
-    inline_imgs_html = ""
-    if inline_images:
-        for img in inline_images:
-            inline_imgs_html += f'\n    <div class="article-image"><img src="images/{img["filename"]}" alt="Chart" loading="lazy"></div>'
+    inline_imgs_html = "".join(
+        "\n    " + ARTICLE_IMAGE_HTML.format(img["filename"]) for img in inline_images or ())
 
     return f'''<div class="team-card {tier_class}" data-rank="{rank}" data-owner="{owner}" id="{week_id}-rank-{rank}">
   <div class="team-header">
@@ -684,10 +722,8 @@ def team_to_html(team, week_id, inline_images=None):
 
 def _should_skip_image(img):
     """Check if an image should be skipped based on SKIP_IMAGES patterns."""
-    for pattern in SKIP_IMAGES:
-        if pattern in img["filename"]:
-            return True
-    return False
+    filename = img["filename"]
+    return any(pattern in filename for pattern in SKIP_IMAGES)
 
 
 def _get_image_owner_override(img):
@@ -720,18 +756,24 @@ def generate_week_html(parsed, week_id, images):
         else:
             parts.append(f'<div class="intro">{writeup_to_html(intro_text)}</div>')
 
-    # Filter and categorize images
-    filtered_images = [img for img in images if not _should_skip_image(img)]
-    header_imgs = [img for img in filtered_images if img["page"] <= 1]
-    content_imgs = [img for img in filtered_images if img["page"] > 1]
-
-    for img in header_imgs:
-        parts.append(f'<div class="article-image"><img src="images/{img["filename"]}" alt="Chart" loading="lazy"></div>')
+    # Filter and categorize images in one pass: header images go out
+    # directly, content images are kept along with their last page
+    content_imgs = []
+    max_page = 1
+    for img in images:
+        if _should_skip_image(img):
+            continue
+        page = img["page"]
+        if page <= 1:
+            parts.append(ARTICLE_IMAGE_HTML.format(img["filename"]))
+        else:
+            content_imgs.append(img)
+            if page > max_page:
+                max_page = page
 
     # Map content images to team indices based on page position or owner override
     team_images = defaultdict(list)
     if content_imgs and total_teams > 0:
-        max_page = max(img["page"] for img in content_imgs)
         for img in content_imgs:
             override_owner = _get_image_owner_override(img)
             if override_owner and override_owner in owner_to_idx:
@@ -749,7 +791,7 @@ def generate_week_html(parsed, week_id, images):
         # Tier header
         if team.get("tier_full") and team["tier_full"] != current_tier:
             current_tier = team["tier_full"]
-            tier_name = html.escape(current_tier)
+            tier_name = _escape(current_tier)
             parts.append(f'<div class="tier-header"><h2>{tier_name}</h2></div>')
 
         # Check if this is a grouped team that should be merged into one card
@@ -758,9 +800,10 @@ def generate_week_html(parsed, week_id, images):
             continue
 
         # Split images for this team: override images go inside the card, others after
-        imgs_for_team = team_images.get(idx, [])
-        override_imgs = [img for img in imgs_for_team if _get_image_owner_override(img)]
-        external_imgs = [img for img in imgs_for_team if not _get_image_owner_override(img)]
+        override_imgs = []
+        external_imgs = []
+        for img in team_images.get(idx, []):
+            (override_imgs if _get_image_owner_override(img) else external_imgs).append(img)
 
         if grouped and team.get("writeup", "").strip():
             parts.append(_grouped_team_to_html(team, teams, week_id))
@@ -770,8 +813,7 @@ def generate_week_html(parsed, week_id, images):
                 parts.append(card_html)
 
         # Insert non-override images after the card
-        for img in external_imgs:
-            parts.append(f'<div class="article-image"><img src="images/{img["filename"]}" alt="Chart" loading="lazy"></div>')
+        parts.extend(ARTICLE_IMAGE_HTML.format(img["filename"]) for img in external_imgs)
 
         # Inject power trios chart + table after the team whose writeup references it
         # Or after Mitch's section if no trigger text found (fallback)
@@ -803,16 +845,21 @@ def generate_week_html(parsed, week_id, images):
     return "\n".join(parts)
 
 
+# Special-section routing by section name
+ODDS_SECTION_RE = re.compile(r'odds', re.IGNORECASE)
+MATCHUP_SECTION_RE = re.compile(r'preview|bracket|matchup|round', re.IGNORECASE)
+
+
 def format_special_section(section_name, section_text):
     """Format special sections with appropriate HTML."""
     escaped_name = html.escape(section_name)
 
     # Odds section → table
-    if re.search(r'odds', section_name, re.IGNORECASE):
+    if ODDS_SECTION_RE.search(section_name):
         return format_odds_section(escaped_name, section_text)
 
     # Matchup/preview sections → bold matchup headers
-    if re.search(r'preview|bracket|matchup|round', section_name, re.IGNORECASE):
+    if MATCHUP_SECTION_RE.search(section_name):
         return format_matchup_section(escaped_name, section_text)
 
     # Default
@@ -820,25 +867,35 @@ def format_special_section(section_name, section_text):
     return f'<div class="special-section"><h2>{escaped_name}</h2>{section_html}</div>'
 
 
+# Matchup patterns: "Team (N) vs. Team (N)", "#N Team vs #N Team", "(N) Team vs (N) Team"
+MATCHUP_RE = re.compile(
+    r'(?:^|\n|(?<=\. )|(?<=\.\s))'  # Start of line, after sentence, etc.
+    r'('
+    r'[A-Z][\w\s\'\.]+?\s*\(\d+\)\s+vs\.?\s+[A-Z][\w\s\'\.]+?\s*\(\d+\)'  # Team (N) vs. Team (N)
+    r'|'
+    r'[#(]?\d+[.)]\s*.+?\s+vs\.?\s+[#(]?\d+[.)]\s*.+?(?=\s|$)'  # #N Team vs #N Team
+    r')'
+)
+
+# Odds table parsing: numeric odds values, column gaps, "Name: value" rows
+ODDS_VALUE_RE = re.compile(r'^[+\-]?\d')
+ODDS_COLUMN_SPLIT_RE = re.compile(r'\t+|\s{3,}')
+ODDS_COLON_SPLIT_RE = re.compile(r':\s+')
+# Lowercased owner names that start the data rows of a columnar odds table
+ODDS_OWNER_NAMES = frozenset(n.lower() for n in [
+    "Sweeney","Joey","Justin","TK","Deez","Mitch","Chris","TJ",
+    "Papi","Matt","Paul","Connor","Gallo","Ger","Mikey","Boyle","Joe"])
+
+
 def format_matchup_section(name, text):
     """Format matchup preview sections with bold matchup headers."""
-    # Matchup patterns: "Team (N) vs. Team (N)", "#N Team vs #N Team", "(N) Team vs (N) Team"
-    matchup_re = re.compile(
-        r'(?:^|\n|(?<=\. )|(?<=\.\s))'  # Start of line, after sentence, etc.
-        r'('
-        r'[A-Z][\w\s\'\.]+?\s*\(\d+\)\s+vs\.?\s+[A-Z][\w\s\'\.]+?\s*\(\d+\)'  # Team (N) vs. Team (N)
-        r'|'
-        r'[#(]?\d+[.)]\s*.+?\s+vs\.?\s+[#(]?\d+[.)]\s*.+?(?=\s|$)'  # #N Team vs #N Team
-        r')'
-    )
-
     # First join all lines into a single text block
     flat = " ".join(line.strip() for line in text.split("\n") if line.strip())
 
     # Split text on matchup headers
     parts_out = []
     last_end = 0
-    for m in matchup_re.finditer(flat):
+    for m in MATCHUP_RE.finditer(flat):
         # Text before this matchup
         before = flat[last_end:m.start()].strip()
         if before:
@@ -871,13 +928,12 @@ def format_odds_section(name, text):
         headers = []
         data_start = 0
         for i, line in enumerate(lines):
-            if re.match(r'^[+\-]?\d', line) or line.lower() in ("off the board", "cooked", "n/a"):
+            line_lower = line.lower()
+            if ODDS_VALUE_RE.match(line) or line_lower in ("off the board", "cooked", "n/a"):
                 data_start = i
                 break
             # Check if this looks like a player name (known owners)
-            if i > 0 and line.lower().rstrip('.') in {n.lower() for n in [
-                "Sweeney","Joey","Justin","TK","Deez","Mitch","Chris","TJ",
-                "Papi","Matt","Paul","Connor","Gallo","Ger","Mikey","Boyle","Joe"]}:
+            if i > 0 and line_lower.rstrip('.') in ODDS_OWNER_NAMES:
                 data_start = i
                 break
             headers.append(line)
@@ -886,40 +942,41 @@ def format_odds_section(name, text):
         data_lines = lines[data_start:]
 
         if num_cols >= 2 and len(data_lines) >= num_cols:
-            table_html = '<table class="odds-table"><thead><tr>'
-            for h in headers:
-                table_html += f'<th>{html.escape(h)}</th>'
-            table_html += '</tr></thead><tbody>'
+            table_parts = ['<table class="odds-table"><thead><tr>']
+            table_parts.extend(f'<th>{html.escape(h)}</th>' for h in headers)
+            table_parts.append('</tr></thead><tbody>')
 
             # Group data lines into rows of num_cols
             for i in range(0, len(data_lines), num_cols):
                 chunk = data_lines[i:i + num_cols]
                 if len(chunk) == num_cols:
-                    table_html += '<tr>' + ''.join(f'<td>{html.escape(c)}</td>' for c in chunk) + '</tr>'
-            table_html += '</tbody></table>'
+                    table_parts.append('<tr>' + ''.join(f'<td>{html.escape(c)}</td>' for c in chunk) + '</tr>')
+            table_parts.append('</tbody></table>')
+            table_html = "".join(table_parts)
             return f'<div class="special-section"><h2>{name}</h2>{table_html}</div>'
 
     # Fallback: try tab/space-delimited rows
     rows = []
     for line in lines:
-        parts = re.split(r'\t+|\s{3,}', line)
+        parts = ODDS_COLUMN_SPLIT_RE.split(line)
         if len(parts) >= 2:
             rows.append(parts)
         else:
-            colon_parts = re.split(r':\s+', line, maxsplit=1)
+            colon_parts = ODDS_COLON_SPLIT_RE.split(line, maxsplit=1)
             if len(colon_parts) == 2:
                 rows.append(colon_parts)
             else:
                 rows.append([line])
 
     if rows and any(len(r) >= 2 for r in rows):
-        table_html = '<table class="odds-table"><tbody>'
+        table_parts = ['<table class="odds-table"><tbody>']
         for row in rows:
             if len(row) >= 2:
-                table_html += '<tr>' + ''.join(f'<td>{html.escape(c.strip())}</td>' for c in row) + '</tr>'
+                table_parts.append('<tr>' + ''.join(f'<td>{html.escape(c.strip())}</td>' for c in row) + '</tr>')
             else:
-                table_html += f'<tr><td colspan="4" class="odds-header">{html.escape(row[0])}</td></tr>'
-        table_html += '</tbody></table>'
+                table_parts.append(f'<tr><td colspan="4" class="odds-header">{html.escape(row[0])}</td></tr>')
+        table_parts.append('</tbody></table>')
+        table_html = "".join(table_parts)
         return f'<div class="special-section"><h2>{name}</h2>{table_html}</div>'
 
     return f'<div class="special-section"><h2>{name}</h2>{writeup_to_html(text)}</div>'
@@ -932,6 +989,10 @@ LOOKBACK_ENTRY_IMAGES = {
 }
 
 
+# Inline "Comparison: ..." tail on a lookback writeup
+LOOKBACK_COMPARISON_RE = re.compile(r'\bComparison\s*[:\-–]')
+
+
 def generate_lookback_html(parsed, images):
     """Generate HTML for the lookback article."""
     parts = []
@@ -942,11 +1003,11 @@ def generate_lookback_html(parsed, images):
 
     for entry in parsed.get("entries", []):
         rank = entry["rank"]
-        owner = html.escape(entry["owner"])
+        owner = _escape(entry["owner"])
         score = entry["power_score"]
         # The presidential comparison is rendered separately below, so strip the
         # inline "Comparison: ..." tail from the writeup to avoid duplicating it.
-        writeup_text = re.split(r'\bComparison\s*[:\-–]', entry["writeup"])[0].rstrip()
+        writeup_text = LOOKBACK_COMPARISON_RE.split(entry["writeup"])[0].rstrip()
         writeup = writeup_to_html(writeup_text)
         comparison = html.escape(entry.get("comparison", ""))
 
@@ -967,12 +1028,26 @@ def generate_lookback_html(parsed, images):
     return "\n".join(parts)
 
 
+def write_json(obj, path, pretty=False, default=None):
+    """Write obj to path as compact UTF-8 JSON, or 2-space indented with pretty=True."""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, default=default, option=option))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        if pretty:
+            json.dump(obj, f, indent=2, ensure_ascii=False, default=default)
+        else:
+            json.dump(obj, f, separators=(",", ":"), ensure_ascii=False, default=default)
+
+
 def main():
+    pretty = "--pretty" in sys.argv[1:]
+
     # Collect all PDFs
-    pdfs = []
-    for f in os.listdir(PDF_DIR):
-        if f.endswith(".pdf"):
-            pdfs.append(os.path.join(PDF_DIR, f))
+    with os.scandir(PDF_DIR) as entries:
+        pdfs = [e.path for e in entries if e.name.endswith(".pdf") and e.is_file()]
 
     # Skip known duplicate/mislabeled PDFs
     SKIP_FILES = {
@@ -1023,26 +1098,22 @@ def main():
     # ===== Compute movement from previous week =====
     prev_owner_ranks = {}
     for file_info, parsed, images, week_id in parsed_weeks:
-        for team in parsed.get("teams", []):
-            owner = team["owner"]
-            if owner and owner in prev_owner_ranks:
-                team["computed_movement"] = prev_owner_ranks[owner] - team["rank"]
-            else:
-                team["computed_movement"] = None
-
-        # Build current owner→rank mapping for next iteration
+        # Build current owner→rank mapping for next iteration in the same pass
         current_ranks = {}
         for team in parsed.get("teams", []):
-            if team["owner"]:
-                current_ranks[team["owner"]] = team["rank"]
+            owner = team["owner"]
+            prev_rank = prev_owner_ranks.get(owner)
+            team["computed_movement"] = prev_rank - team["rank"] if prev_rank is not None else None
+            if owner:
+                current_ranks[owner] = team["rank"]
         prev_owner_ranks = current_ranks
 
     # ===== SECOND PASS: Generate JSON + HTML =====
     all_weeks = []
     all_owners_data = defaultdict(lambda: {
         "rankings": [],
-        "team_names": set(),
-        "seasons": set(),
+        "team_names": [],  # a handful per owner, so lists beat sets
+        "seasons": [],
     })
 
     for file_info, parsed, images, week_id in parsed_weeks:
@@ -1052,38 +1123,43 @@ def main():
         # Generate HTML content
         week_html = generate_week_html(parsed, week_id, images)
 
-        with open(os.path.join(DATA_DIR, f"{week_id}.html"), "w") as f:
+        with open(os.path.join(DATA_DIR, f"{week_id}.html"), "w", encoding="utf-8") as f:
             f.write(week_html)
 
         # Build week JSON data
         teams_json = []
+        season, week = file_info["season"], file_info["week"]
         for team in parsed.get("teams", []):
-            movement = team.get("computed_movement")
+            owner = team["owner"]
+            rank = team["rank"]
+            display_name = _display_team_name(team["team_name"], owner, season)
             teams_json.append({
-                "rank": team["rank"],
-                "team_name": _display_team_name(team["team_name"], team["owner"], file_info["season"]),
-                "owner": team["owner"],
-                "movement": movement,
+                "rank": rank,
+                "team_name": display_name,
+                "owner": owner,
+                "movement": team.get("computed_movement"),
                 "tier": team.get("tier"),
-                "subsections": list(team.get("subsections", {}).keys()),
+                "subsections": list(team.get("subsections", ())),
             })
 
             # Track owner data
-            owner = team["owner"]
             if owner:
-                all_owners_data[owner]["rankings"].append({
-                    "season": file_info["season"],
-                    "week": file_info["week"],
+                owner_data = all_owners_data[owner]
+                owner_data["rankings"].append({
+                    "season": season,
+                    "week": week,
                     "week_id": week_id,
-                    "rank": team["rank"],
+                    "rank": rank,
                 })
-                all_owners_data[owner]["team_names"].add(_display_team_name(team["team_name"], owner, file_info["season"]))
-                all_owners_data[owner]["seasons"].add(file_info["season"])
+                if display_name not in owner_data["team_names"]:
+                    owner_data["team_names"].append(display_name)
+                if season not in owner_data["seasons"]:
+                    owner_data["seasons"].append(season)
 
         week_json = {
             "week_id": week_id,
-            "season": file_info["season"],
-            "week": file_info["week"],
+            "season": season,
+            "week": week,
             "type": file_info["type"],
             "title": parsed.get("title", ""),
             "label": get_display_label(file_info),
@@ -1093,31 +1169,28 @@ def main():
             "image_count": len(images),
         }
 
-        with open(os.path.join(DATA_DIR, f"{week_id}.json"), "w") as f:
-            json.dump(week_json, f, indent=2)
+        write_json(week_json, os.path.join(DATA_DIR, f"{week_id}.json"), pretty)
 
         all_weeks.append(week_json)
 
     # ===== Process lookback =====
     if lookback_data:
         lookback_html = generate_lookback_html(lookback_data, lookback_images or [])
-        with open(os.path.join(DATA_DIR, "lookback_content.html"), "w") as f:
+        with open(os.path.join(DATA_DIR, "lookback_content.html"), "w", encoding="utf-8") as f:
             f.write(lookback_html)
         lookback_json = {
             "title": lookback_data["title"],
             "intro": lookback_data["intro"],
             "entries": lookback_data["entries"],
         }
-        with open(os.path.join(DATA_DIR, "lookback.json"), "w") as f:
-            json.dump(lookback_json, f, indent=2, default=list)
+        write_json(lookback_json, os.path.join(DATA_DIR, "lookback.json"), pretty, default=list)
 
     # ===== Save rankings index =====
     rankings_index = {
         "seasons": ["2024", "2025"],
         "weeks": all_weeks,
     }
-    with open(os.path.join(DATA_DIR, "rankings.json"), "w") as f:
-        json.dump(rankings_index, f, indent=2)
+    write_json(rankings_index, os.path.join(DATA_DIR, "rankings.json"), pretty)
 
     # ===== Build and save owners data =====
     owners_json = {}
@@ -1134,13 +1207,12 @@ def main():
             "avg_rank": round(sum(ranks) / len(ranks), 2),
             "best_rank": min(ranks),
             "worst_rank": max(ranks),
-            "weeks_at_1": sum(1 for r in ranks if r == 1),
-            "weeks_at_16": sum(1 for r in ranks if r == 16),
+            "weeks_at_1": ranks.count(1),
+            "weeks_at_16": ranks.count(16),
             "rankings": sorted(rankings, key=lambda r: (r["season"], r["week"] or 0)),
         }
 
-    with open(os.path.join(DATA_DIR, "owners.json"), "w") as f:
-        json.dump(owners_json, f, indent=2)
+    write_json(owners_json, os.path.join(DATA_DIR, "owners.json"), pretty)
 
     print(f"\n=== Summary ===")
     print(f"Weeks processed: {len(all_weeks)}")